@@ -27,13 +27,16 @@ configuration load and logging setup.
 
 """
 
-SECRET_MASKS: MutableSequence[Callable] = [
+SECRET_MASKS: MutableSequence[Union[Callable, re.Pattern]] = [
     # mask if contains a kind of secret and it's not in a file
     re.compile(
         r'.*(key|password|secret)s?(?!_file)(?!_path)(_|$)|^(authentication|private)(_key|$)'
     ).match,
 ]
-"""A list of functions which given a key indicate whether it's a secret"""
+"""A list of functions which given a key indicate whether it's a secret
+
+Compiled regexes can be added directly, they are matched against the key.
+"""
 
 T = TypeVar('T')
 
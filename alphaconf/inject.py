@@ -13,20 +13,45 @@ class ParamDefaultsFunction:
     """Function wrapper that injects default parameters"""
 
     _arg_factory: dict[str, Callable[[], Any]]
+    _positions: dict[str, int]
+    _keywords: frozenset[str]
+    _var_keyword: Optional[str]
 
     def __init__(self, func: Callable):
         self.func = func
         self.signature = inspect.signature(func)
         self._arg_factory = {}
+        # index of parameters that can be passed positionally (*args included)
+        self._positions = {}
+        self._var_keyword = None
+        for i, (name, param) in enumerate(self.signature.parameters.items()):
+            if param.kind == param.VAR_KEYWORD:
+                self._var_keyword = name
+            elif param.kind != param.KEYWORD_ONLY:
+                self._positions[name] = i
+        # names that do not end up in **kwargs
+        self._keywords = frozenset(
+            name
+            for name, param in self.signature.parameters.items()
+            if param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY)
+        )
 
     def bind(self, name: str, factory: Callable[[], Any]):
         self._arg_factory[name] = factory
 
     def __call__(self, *a, **kw):
-        args = self.signature.bind_partial(*a, **kw).arguments
-        kw.update(
-            {name: factory() for name, factory in self._arg_factory.items() if name not in args}
-        )
+        has_var_keyword = not self._keywords.issuperset(kw)
+        values = {}
+        for name, factory in self._arg_factory.items():
+            position = self._positions.get(name)
+            if (
+                name in kw
+                or (position is not None and position < len(a))
+                or (name == self._var_keyword and has_var_keyword)
+            ):
+                continue
+            values[name] = factory()
+        kw.update(values)
         return self.func(*a, **kw)
 
     @staticmethod
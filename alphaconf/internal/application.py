@@ -1,16 +1,93 @@
+import functools
 import itertools
 import logging
 import os
+import re
 import sys
 import uuid
 from collections.abc import Iterable, MutableMapping
-from typing import Callable, Optional, Union, cast
+from typing import Any, Callable, Optional, Union, cast
 
 from omegaconf import DictConfig, OmegaConf
 
 from . import arg_parser, load_file
 from .configuration import Configuration
 
+# generate the uuid only when the value is resolved
+if not OmegaConf.has_resolver('alphaconf_uuid'):
+    OmegaConf.register_new_resolver('alphaconf_uuid', lambda: str(uuid.uuid4()), use_cache=True)
+
+_BACKREFERENCE = re.compile(r'\\[1-9]|\(\?P=')
+
+
+@functools.lru_cache(maxsize=8)
+def _secret_check(masks: tuple[Union[Callable, re.Pattern], ...]) -> Callable[[str], Any]:
+    """Build a single check from SECRET_MASKS
+
+    The `re.Pattern` and `re.Pattern.match` masks are combined into a single regex.
+    """
+    patterns = []
+    checks = []
+    for mask in masks:
+        pattern: Optional[re.Pattern]
+        if isinstance(mask, re.Pattern):
+            pattern, mask = mask, mask.match
+        else:
+            pattern = getattr(mask, '__self__', None)
+        if (
+            isinstance(pattern, re.Pattern)
+            and mask.__name__ == 'match'
+            and pattern.flags == re.UNICODE
+            and not pattern.groupindex
+            and not _BACKREFERENCE.search(pattern.pattern)
+        ):
+            patterns.append(pattern.pattern)
+        else:
+            checks.append(mask)
+    if patterns:
+        checks.insert(0, re.compile('|'.join(f"(?:{p})" for p in patterns)).match)
+    if len(checks) == 1:
+        return checks[0]
+    return lambda key: any(check(key) for check in checks)
+
+
+@functools.lru_cache(maxsize=4)
+def _default_name(argv0: str) -> str:
+    """Find the default application name from the executed script"""
+    name = os.path.basename(argv0)
+    if name.endswith('.py'):
+        name = name[:-3]
+    if name == '__main__':
+        # executing a module using python -m
+        name = os.path.basename(os.path.dirname(argv0))
+    return name
+
+
+_PATH_VARIABLES = ('APPDATA', 'LOCALAPPDATA', 'HOME', 'PWD')
+
+
+@functools.lru_cache(maxsize=32)
+def _configuration_paths(
+    name: str, is_windows: bool, environ: tuple[Optional[str], ...]
+) -> tuple[str, ...]:
+    """List of paths where to find configuration files
+
+    :param environ: Values of _PATH_VARIABLES, part of the cache key
+    """
+    appdata, localappdata, home, pwd = environ
+    prefixes = [
+        (appdata and f"{appdata}/") if is_windows else '/etc/',
+        (localappdata and f"{localappdata}/") if is_windows else None,
+        home and f"{home}/.",
+        home and f"{home}/.config/",
+        pwd and f"{pwd}/",
+    ]
+    paths: list[str] = []
+    for prefix in prefixes:
+        if prefix:
+            paths.extend(f"{prefix}{name}.{ext}" for ext in load_file.SUPPORTED_EXTENSIONS)
+    return tuple(paths)
+
 
 class Application:
     """An application description"""
@@ -51,13 +128,7 @@ class Application:
     @staticmethod
     def __get_default_name() -> str:
         """Find the default name from sys.argv"""
-        name = os.path.basename(sys.argv[0])
-        if name.endswith('.py'):
-            name = name[:-3]
-        if name == '__main__':
-            # executing a module using python -m
-            name = os.path.basename(os.path.dirname(sys.argv[0]))
-        return name
+        return _default_name(sys.argv[0])
 
     def _app_configuration(self) -> DictConfig:
         """Get the application configuration key"""
@@ -66,7 +137,7 @@ class Application:
                 'application': {
                     'name': self.name,
                     'version': self.properties.get('version') or '',
-                    'uuid': str(uuid.uuid4()),
+                    'uuid': '${alphaconf_uuid:}',
                 },
             }
         )
@@ -87,41 +158,28 @@ class Application:
 
     def _get_possible_configuration_paths(self) -> Iterable[str]:
         """List of paths where to find configuration files"""
-        name = self.name
         is_windows = sys.platform.startswith('win')
-        for path in [
-            '$APPDATA/{}' if is_windows else '/etc/{}',
-            '$LOCALAPPDATA/{}' if is_windows else '',
-            '$HOME/.{}',
-            '$HOME/.config/{}',
-            '$PWD/{}',
-        ]:
-            path = path and os.path.expandvars(path)
-            if path and '$' not in path:
-                for ext in load_file.SUPPORTED_EXTENSIONS:
-                    yield path.format(f"{name}.{ext}")
+        environ = tuple(os.environ.get(var) for var in _PATH_VARIABLES)
+        return _configuration_paths(self.name, is_windows, environ)
 
     def _get_configurations(
         self,
         configuration_paths: Iterable[str] = [],
         env_prefixes: Union[bool, Iterable[str]] = True,
-    ) -> Iterable[DictConfig]:
+    ) -> list[DictConfig]:
         """List of all configurations that can be loaded automatically
 
-        - Global configuration
         - The app configuration
         - Read file defined in PYTHON_ALPHACONF
         - Reads existing files from possible configuration paths
         - Reads environment variables based on given prefixes
 
         :param env_prefixes: Prefixes of environment variables to load
-        :return: OmegaConf configurations (to be merged)
+        :return: OmegaConf configurations (to be merged into the global one)
         """
-        self.log.debug('Loading default and app configurations')
+        self.log.debug('Loading app configuration')
         assert self.__config is not None
-        default_configuration = self.__config.c
-        yield default_configuration
-        yield self._app_configuration()
+        configurations = [self._app_configuration()]
         # Read files
         env_configuration_path = os.environ.get('PYTHON_ALPHACONF') or ''
         for path in itertools.chain(
@@ -132,26 +190,22 @@ class Application:
             if not os.path.isfile(path):
                 continue
             self.log.debug('Load configuration from %s', path)
-            yield load_file.read_configuration_file(path)
+            configurations.append(load_file.read_configuration_file(path))
         # Environment
         prefixes: Optional[tuple[str, ...]]
         if env_prefixes is True:
             self.log.debug('Detecting accepted env prefixes')
-            default_keys = {str(k) for k in default_configuration}
-            prefixes = tuple(
-                k.upper() + '_'
-                for k in default_keys
-                if k not in ('base', 'python') and not k.startswith('_')
-            )
+            prefixes = self.__config.default_env_prefixes()
         elif isinstance(env_prefixes, Iterable):
             prefixes = tuple(env_prefixes)
         else:
             prefixes = None
         if prefixes:
             self.log.debug('Loading env configuration from prefixes %s', prefixes)
-            yield self.__config.from_environ(prefixes)
+            configurations.append(self.__config.from_environ(prefixes))
         if self.parsed:
-            yield from self.parsed.configurations()
+            configurations.extend(self.parsed.configurations())
+        return configurations
 
     def setup_configuration(
         self,
@@ -165,10 +219,13 @@ class Application:
         from .. import _global_configuration as ctx_configuration  # noqa: TID252
         from .dotenv_vars import try_dotenv
 
-        try_dotenv(load_dotenv=load_dotenv)
-
         self.log.debug('Parse arguments')
         self.parsed = self.argument_parser.parse_args(arguments)
+        if isinstance(self.parsed.result, (arg_parser.HelpAction, arg_parser.VersionAction)):
+            # the configuration is not needed to show the help or the version
+            self._handle_parsed_result()
+
+        try_dotenv(load_dotenv=load_dotenv)
 
         self.log.debug('Start setup configuration')
         self.__config = Configuration(parent=ctx_configuration)
@@ -211,58 +268,55 @@ class Application:
         from .. import SECRET_MASKS  # noqa: TID252
 
         config = cast(dict, OmegaConf.to_container(self.configuration.c))
-        if mask_secrets:
-            config = Application.__mask_config(
-                config,
-                lambda p: any(mask(p) for mask in SECRET_MASKS),
-                lambda v: v if v is None or v == '???' else '*****',
-            )
-        if mask_base and 'base' not in mask_keys:
-            # first remove all values if the object is not resolved
-            config['base'] = Application.__mask_config(
-                config['base'],
-                lambda p: not isinstance(
-                    OmegaConf.select(self.configuration.c, p, throw_on_resolution_failure=False),
-                    DictConfig,
-                ),
-                lambda v: {},
-            )
-            # then collapse dict[str,None] into a list[str]
-            config['base'] = Application.__mask_config(
-                config['base'],
-                lambda _: True,
-                lambda v: list(v) if isinstance(v, dict) and not any(v.values()) else v,
-            )
-        if mask_keys:
-            config = Application.__mask_config(config, lambda p: p in mask_keys, lambda _: None)
+        if mask_base and 'base' not in mask_keys and isinstance(config.get('base'), dict):
+            # show only the names of the base templates
+            config['base'] = {
+                k: list(v) if isinstance(v, dict) else v for k, v in config['base'].items()
+            }
+        masked_keys = set(mask_keys)
+        is_secret = _secret_check(tuple(SECRET_MASKS)) if mask_secrets else None
+
+        def mask(path: str, value):
+            if path in masked_keys:
+                return None
+            if is_secret and value is not None and value != '???' and is_secret(path):
+                return '*****'
+            return value
+
+        if masked_keys or is_secret:
+            config = Application.__mask_config(config, mask)
         return config
 
     @staticmethod
-    def __mask_config(obj, check: Callable[[str], bool], replace: Callable, path: str = ''):
-        """Alter the configuration dict
+    def __mask_config(obj, mask: Callable[[str, Any], Any]):
+        """Alter the configuration container in place
 
-        :param config: The value to mask
-        :param check: Function to check if we replace the value (path: str) -> bool
-        :param replace: Function doing the replacement of the value (v) -> Any
-        :param key: Current path
+        :param obj: The container to mask (dict or list)
+        :param mask: Function returning the replacement of the value (path: str, v) -> Any,
+                     None removes the value
         :return: The modified config
         """
-        if check(path):
-            obj = replace(obj)
-        if isinstance(obj, dict):
-            result = {}
-            for key, value in obj.items():
-                new = Application.__mask_config(
-                    value, check, replace, f"{path}.{key}" if path else key
-                )
-                if new is not None:
-                    result[key] = new
-            obj = result
-        elif isinstance(obj, list):
-            obj = [
-                Application.__mask_config(v, check, replace, f"{path}[{i}]")
-                for i, v in enumerate(obj)
-            ]
+        obj = mask('', obj)
+        stack = [(obj, '')]
+        while stack:
+            container, path = stack.pop()
+            if isinstance(container, dict):
+                for key, value in list(container.items()):
+                    sub_path = f"{path}.{key}" if path else key
+                    new = mask(sub_path, value)
+                    if new is None:
+                        del container[key]
+                        continue
+                    if new is not value:
+                        container[key] = new
+                    if isinstance(new, (dict, list)):
+                        stack.append((new, sub_path))
+            elif isinstance(container, list):
+                for i, value in enumerate(container):
+                    sub_path = f"{path}[{i}]"
+                    new = container[i] = mask(sub_path, value)
+                    if isinstance(new, (dict, list)):
+                        stack.append((new, sub_path))
         return obj
 
     def print_help(self, *, arguments: bool = True):
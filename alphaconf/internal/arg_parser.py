@@ -4,12 +4,12 @@ from typing import Optional, Union, cast
 
 from omegaconf import DictConfig, OmegaConf
 
+from . import load_file
+
 
 def _split(value: str, char: str = "=") -> tuple[str, Optional[str]]:
-    vs = value.split(char, 1)
-    if len(vs) < 2:
-        return vs[0], None
-    return vs[0], vs[1]
+    key, sep, rest = value.partition(char)
+    return key, (rest if sep else None)
 
 
 class ExitApplication(BaseException):
@@ -108,7 +108,7 @@ class ConfigurationFileAction(ConfigurationAction):
         return None
 
     def handle(self, result, value):
-        result._add_config(OmegaConf.load(value))
+        result._add_config(load_file.read_configuration_file(value))
 
 
 class ConfigurationSelectAction(ConfigurationAction):
@@ -1,5 +1,7 @@
 import copy
 import os
+import re
+import string
 import warnings
 from collections.abc import Iterable, MutableMapping
 from enum import Enum
@@ -13,6 +15,7 @@ from typing import (
 )
 
 from omegaconf import Container, DictConfig, OmegaConf
+from yaml.error import YAMLError
 
 from .type_resolvers import convert_to_type, pydantic, type_from_annotation
 
@@ -26,23 +29,46 @@ class RaiseOnMissingType(Enum):
 raise_on_missing = RaiseOnMissingType.RAISE
 _cla_type = type
 
+# values which YAML loads as the same string
+_PLAIN_STRING = re.compile(r'(?:[^\W\d]|/)[\w./:@-]*(?<!:)')
+_YAML_KEYWORDS = frozenset(['yes', 'no', 'true', 'false', 'on', 'off', 'null'])
+# translation of environment variable names into paths (lowercase ASCII)
+_ENV_NAME_TRANS = str.maketrans(
+    {**{c: c.lower() for c in string.ascii_uppercase}, '_': '.', '"': None, '\\': None, '=': None}
+)
+
+
+def _is_plain_string(value: str) -> bool:
+    """Check whether the value would be loaded as a string by YAML"""
+    return _PLAIN_STRING.fullmatch(value) is not None and value.lower() not in _YAML_KEYWORDS
+
+
+def _set_nested(obj: dict, parts: list[str], value: str) -> None:
+    """Set a value in nested dicts"""
+    for part in parts[:-1]:
+        obj = obj.setdefault(part, {})
+    obj[parts[-1]] = value
+
 
 class Configuration:
     c: DictConfig
     __type_path: MutableMapping[type, Optional[str]]
-    __type_value: MutableMapping[type, Any]
+    __env_prefixes: Optional[tuple[str, ...]]
     helpers: dict[str, str]
 
     def __init__(self, *, parent: Optional["Configuration"] = None) -> None:
         if parent:
             self.c = OmegaConf.create(parent.c)
+            # values of cached resolvers (application uuid) are not inherited
+            OmegaConf.clear_cache(self.c)
             self.helpers = copy.copy(parent.helpers)
             self.__type_path = copy.copy(parent.__type_path)
+            self.__env_prefixes = parent.__env_prefixes
         else:
             self.c = OmegaConf.create({})
             self.helpers = {}
             self.__type_path = {}
-        self.__type_value = {}
+            self.__env_prefixes = None
 
     @overload
     def get(
@@ -87,7 +113,7 @@ class Configuration:
                 raise KeyError(f"No value for: {key}")
             return default
         # check the returned type and convert when necessary
-        if type is not None and isinstance(value, type):
+        if isinstance(type, _cla_type) and isinstance(value, type):
             return value
         if isinstance(value, Container):
             value = OmegaConf.to_object(value)
@@ -96,26 +122,30 @@ class Configuration:
         return value
 
     def __get_type(self, key: type, *, default=raise_on_missing):
-        value = self.__type_value.get(key)
-        if value is not None:
-            return value
         key_str = self.__type_path.get(key)
         if key_str is None:
             if default is raise_on_missing:
                 raise KeyError(f"Key not found for type {key}")
             return default
         try:
-            value = self.get(key_str, key)
-            self.__type_value = value
+            return self.get(key_str, key)
         except KeyError:
             if default is raise_on_missing:
                 raise
-            value = default
-        return value
+            return default
 
     def _merge(self, configs: Iterable[DictConfig]):
-        """Merge the current configuration with the given ones"""
-        self.c = cast(DictConfig, OmegaConf.merge(self.c, *configs))
+        """Merge the current configuration with the given ones
+
+        The merge is done in place without copying the given configurations,
+        they should not be used afterwards.
+        """
+        # empty configurations do not change the result
+        configs = [c for c in configs if c]
+        if not configs:
+            return
+        self.c = cast(DictConfig, OmegaConf.unsafe_merge(self.c, *configs))
+        self.__env_prefixes = None
 
     def setup_configuration(
         self,
@@ -139,7 +169,6 @@ class Configuration:
         if conf_type:
             # if already registered, set path to None
             self.__type_path[conf_type] = None if conf_type in self.__type_path else prefix
-            self.__type_value.pop(conf_type, None)
         if prefix and not prefix.endswith('.'):
             prefix += "."
         if isinstance(conf, str):
@@ -148,10 +177,15 @@ class Configuration:
             if not isinstance(created_config, DictConfig):
                 raise ValueError("The config is not a dict")
             conf = created_config
+        elif isinstance(conf, DictConfig):
+            # copy because the merge is done in place
+            conf = copy.deepcopy(conf)
         if isinstance(conf, DictConfig):
             config = self.__prepare_dictconfig(conf, path=prefix)
         else:
             created_config = self.__prepare_config(conf, path=prefix)
+            if isinstance(created_config, dict):
+                created_config = OmegaConf.create(created_config)
             if not isinstance(created_config, DictConfig):
                 raise TypeError("Failed to convert to a DictConfig")
             config = created_config
@@ -161,26 +195,72 @@ class Configuration:
             helpers = {prefix + k: v for k, v in helpers.items()}
         self._merge([config])
         # helpers
-        self.helpers.update(**helpers)
+        self.helpers.update(helpers)
 
     def add_helper(self, key, description):
         """Assign a helper description"""
         self.helpers[key] = description
 
+    def default_env_prefixes(self) -> tuple[str, ...]:
+        """Prefixes of environment variables based on the top-level keys
+
+        The result is cached until the next merge.
+        """
+        if self.__env_prefixes is None:
+            self.__env_prefixes = tuple(
+                k.upper() + '_'
+                for k in map(str, self.c)
+                if k not in ('base', 'python') and not k.startswith('_')
+            )
+        return self.__env_prefixes
+
     def from_environ(self, prefixes: Iterable[str]) -> DictConfig:
         """Load environment variables into a dict configuration"""
-        from yaml.error import YAMLError  # type: ignore
-
-        trans = str.maketrans('_', '.', '"\\=')
         prefixes = tuple(prefixes)
-        dotlist = [
-            (name.lower().translate(trans).strip('.'), value)
-            for name, value in os.environ.items()
-            if name.startswith(prefixes)
-        ]
-        conf = OmegaConf.create({})
+        if not prefixes:
+            return OmegaConf.create({})
+        # filter on names first, so only matching values are decoded
+        environ = os.environ
+        if all(prefixes):
+            # cheap rejection on the first character before startswith
+            first_chars = frozenset(prefix[0] for prefix in prefixes)
+            names = [name for name in environ if name[:1] in first_chars]
+        else:
+            names = list(environ)
+        variables = {name: environ[name] for name in names if name.startswith(prefixes)}
+        paths = []
+        for name in variables:
+            if not name.isascii():
+                name = name.lower()
+            parts = name.translate(_ENV_NAME_TRANS).strip('.').split('.')
+            paths.append(Configuration._find_name(parts, self.c))
+        # when a path is set twice or is the parent of another one, the order
+        # of the variables matters, so all values are parsed as a dotlist
+        unique_paths = set(paths)
+        ordered = len(unique_paths) < len(paths) or any(
+            path[:i] in unique_paths
+            for path in unique_paths
+            for i, char in enumerate(path)
+            if char == '.'
+        )
+        # plain strings are set directly, other values are parsed as a dotlist
+        values: dict[str, Any] = {}
+        dotlist = []
+        for name, value in zip(paths, variables.values()):
+            if ordered or not _is_plain_string(value):
+                dotlist.append((name, value))
+            else:
+                _set_nested(values, name.split('.'), value)
+        conf = OmegaConf.create(values)
+        if not dotlist:
+            return conf
+        try:
+            parsed = OmegaConf.from_dotlist([f"{name}={value}" for name, value in dotlist])
+            return cast(DictConfig, OmegaConf.unsafe_merge(conf, parsed))
+        except YAMLError:
+            pass
+        # some values cannot be loaded, add them one by one
         for name, value in dotlist:
-            name = Configuration._find_name(name.split('.'), self.c)
             try:
                 conf.merge_with_dotlist([f"{name}={value}"])
             except YAMLError:
@@ -236,7 +316,10 @@ class Configuration:
                 changed |= v is not nv
             if not changed:
                 result = obj
-            return self.__prepare_dictconfig(OmegaConf.create(result), path, recursive=False)
+            if any('.' in k for k in result):
+                return self.__prepare_dictconfig(OmegaConf.create(result), path, recursive=False)
+            # keep plain dicts, the DictConfig is created once by the caller
+            return result
         return obj
 
     def __prepare_pydantic(self, obj, path):
@@ -1,11 +1,22 @@
 import datetime
+import functools
+import importlib.util
+import os
 from typing import Any
 
+import yaml
 from omegaconf import DictConfig, OmegaConf
+from omegaconf._utils import get_yaml_loader
 
 SUPPORTED_EXTENSIONS = ['yaml', 'json']
 
-try:
+# toml is imported only when reading a toml file
+if importlib.util.find_spec('toml') is not None:
+    SUPPORTED_EXTENSIONS.append('toml')
+
+
+@functools.lru_cache(maxsize=1)
+def _toml_decoder_class() -> type:
     import toml
 
     class TomlDecoderPrimitive(toml.TomlDecoder):
@@ -22,9 +33,53 @@ try:
                     value = value.isoformat()
             return value, itype
 
-    SUPPORTED_EXTENSIONS.append('toml')
-except ImportError:
-    toml = None  # type: ignore
+    return TomlDecoderPrimitive
+
+
+def _yaml_loader() -> type:
+    """YAML loader with the same rules as OmegaConf, using libyaml when available"""
+    omegaconf_loader = get_yaml_loader()
+    if not getattr(yaml, '__with_libyaml__', False):
+        return omegaconf_loader
+
+    class YamlLoader(yaml.CSafeLoader):
+        yaml_implicit_resolvers = omegaconf_loader.yaml_implicit_resolvers
+        yaml_constructors = omegaconf_loader.yaml_constructors
+
+        def construct_mapping(self, node, deep=False):
+            keys = set()
+            for key_node, _ in node.value:
+                if key_node.tag != yaml.resolver.BaseResolver.DEFAULT_SCALAR_TAG:
+                    continue
+                if key_node.value in keys:
+                    raise yaml.constructor.ConstructorError(
+                        "while constructing a mapping",
+                        node.start_mark,
+                        f"found duplicate key {key_node.value}",
+                        key_node.start_mark,
+                    )
+                keys.add(key_node.value)
+            return super().construct_mapping(node, deep=deep)
+
+    return YamlLoader
+
+
+YamlLoader = _yaml_loader()
+
+
+@functools.lru_cache(maxsize=64)
+def _read_file_data(path: str, file_id: tuple[int, int, int, int]) -> Any:
+    """Parse the file, the result is cached by absolute path and file identity
+
+    :param file_id: (device, inode, size, modification time) of the file
+    :return: The parsed data, shared, so it must not be modified
+    """
+    if path.endswith('.toml') and 'toml' in SUPPORTED_EXTENSIONS:
+        import toml
+
+        return dict(toml.load(path, decoder=_toml_decoder_class()()))
+    with open(path, encoding='utf-8') as f:
+        return yaml.load(f, Loader=YamlLoader)
 
 
 def read_configuration_file(path: str) -> DictConfig:
@@ -33,10 +88,11 @@ def read_configuration_file(path: str) -> DictConfig:
     The result is always a DictConfig.
     When the file contains a list, it's embedded in a Dict with a key 'config'.
     """
-    if path.endswith('.toml') and toml:
-        config = toml.load(path, decoder=TomlDecoderPrimitive())
-        return OmegaConf.create(dict(config))
-    conf = OmegaConf.load(path)
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    data = _read_file_data(path, (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns))
+    # create() copies the data into new nodes
+    conf = OmegaConf.create(data) if data is not None else OmegaConf.create()
     if not isinstance(conf, DictConfig):
         conf = OmegaConf.create({'config': conf})
     return conf
@@ -1,4 +1,5 @@
 import datetime
+import functools
 import typing
 from pathlib import Path
 
@@ -43,6 +44,12 @@ for _name, _function in TYPE_CONVERTER.items():
         OmegaConf.register_new_resolver(_name, _function)  # type: ignore
 
 
+@functools.lru_cache(maxsize=128)
+def _type_adapter(type):
+    """Get a (cached) pydantic adapter for the type"""
+    return pydantic.TypeAdapter(type)
+
+
 def convert_to_type(value, type):
     """Converts a value to the given type.
 
@@ -60,7 +67,7 @@ def convert_to_type(value, type):
     if type in TYPE_CONVERTER:
         return TYPE_CONVERTER[type](value)
     if pydantic:
-        return pydantic.TypeAdapter(type).validate_python(value)
+        return _type_adapter(type).validate_python(value)
     return type(value)
 
 
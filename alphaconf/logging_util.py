@@ -1,6 +1,7 @@
 import collections
 import json
 import logging
+import logging.config
 import traceback
 from logging import Formatter, LogRecord
 from typing import Any, Callable, Union
@@ -42,14 +43,10 @@ def setup_application_logging(configuration: Union[dict, None]) -> None:
 
     Set the time to GMT, log key 'logging' from configuration or if none, base logging.
     """
-    import logging
-
     set_gmt()
     log = logging.getLogger()
     if configuration:
         # Configure using the st configuration
-        import logging.config
-
         logging.config.dictConfig(configuration)
     elif len(log.handlers) == 0:
         # Default logging if not yet initialized
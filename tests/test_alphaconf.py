@@ -1,4 +1,5 @@
 import os
+import re
 
 import pytest
 from omegaconf import DictConfig, OmegaConf
@@ -53,6 +54,14 @@ def test_run_application_version(capsys, application):
     assert (application.name + ' ' + application.properties['version']) in out
 
 
+def test_run_application_version_no_load(capsys, application, monkeypatch, tmp_path):
+    path = tmp_path / 'invalid.yaml'
+    path.write_text('invalid: [')
+    monkeypatch.setenv('PYTHON_ALPHACONF', str(path))
+    alphaconf.cli.run(lambda: 'n', app=application, arguments=['--version'], should_exit=False)
+    assert application.properties['version'] in capsys.readouterr().out
+
+
 def test_run_application_show_configuration(capsys, application):
     alphaconf.cli.run(
         lambda: 'n', app=application, arguments=['--configuration'], should_exit=False
@@ -137,3 +146,60 @@ def test_app_environ(application):
         config.get('xxx')
     assert config.get('testmyenv.x') == 'overwrite'
     assert config.get('testmyenv.y') == 'new'
+
+
+def test_secret_masks_combined():
+    from alphaconf.internal.application import _secret_check
+
+    check = _secret_check(
+        (
+            *alphaconf.SECRET_MASKS,
+            re.compile(r'.*token$').match,
+            re.compile(r'^private$'),
+            lambda p: p == 'a.b',
+        )
+    )
+    assert check('password')
+    assert check('my_token')
+    assert check('a.b')
+    assert check('private')
+    assert not check('a.c')
+    assert not check('password_file')
+
+
+def test_app_configuration_paths(application, monkeypatch):
+    monkeypatch.setenv('HOME', '/home/first')
+    assert '/home/first/.config/test.yaml' in application._get_possible_configuration_paths()
+    monkeypatch.setenv('HOME', '/home/second')
+    paths = application._get_possible_configuration_paths()
+    assert '/home/second/.config/test.yaml' in paths
+    assert not any(p.startswith('/home/first') for p in paths)
+
+
+def test_masked_configuration_base():
+    alphaconf.setup_configuration({'base': {'db': {'a': {'host': 1}, 'b': {'host': 2}}}})
+    conf = alphaconf.Application().masked_configuration()
+    assert conf['base']['logging'] == ['default', 'none']
+    assert conf['base']['db'] == ['a', 'b']
+    assert 'uuid' not in conf['application']
+    conf = alphaconf.Application().masked_configuration(mask_keys=['base.db', 'application'])
+    assert 'db' not in conf['base']
+    assert 'application' not in conf
+
+
+def test_app_uuid(application):
+    application.setup_configuration(load_dotenv=False, resolve_configuration=False)
+    uuid = application.configuration.get('application.uuid')
+    assert len(uuid) == 36
+    assert application.configuration.get('application.uuid') == uuid
+    other = alphaconf.Application(name='other')
+    other.setup_configuration(load_dotenv=False)
+    assert other.configuration.get('application.uuid') != uuid
+
+
+def test_app_uuid_parent_resolved(application):
+    # the uuid cached in the parent configuration is not copied
+    alphaconf.setup_configuration({'application': {'uuid': '${alphaconf_uuid:}'}})
+    uuid = alphaconf.get('application.uuid')
+    application.setup_configuration(load_dotenv=False)
+    assert application.configuration.get('application.uuid') != uuid
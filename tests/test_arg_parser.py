@@ -49,3 +49,12 @@ def test_parse_arguments(parser):
 def test_parse_invalid(parser):
     with pytest.raises(ap.ArgumentError):
         parser.parse_args(['--hello-world'])
+
+
+def test_parse_config_file(parser, tmp_path):
+    parser.add_argument(ap.ConfigurationFileAction, '-f', metavar='path')
+    path = tmp_path / 'test.yaml'
+    path.write_text('hello: file\nx: 1\n')
+    r = parser.parse_args(['hello=world', '-f', str(path), 'x=2'])
+    conf = OmegaConf.merge(*r.configurations())
+    assert conf.hello == 'file' and conf.x == 2
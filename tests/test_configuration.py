@@ -1,7 +1,7 @@
 from pathlib import Path
 
 import pytest
-from omegaconf import DictConfig
+from omegaconf import DictConfig, OmegaConf
 
 from alphaconf import Configuration
 
@@ -51,6 +51,9 @@ def test_cast(config):
     assert config.get('b', int, default=None) == 1
     # cast Path
     assert isinstance(config.get('home', Path), Path)
+    # cast using a converter name
+    config.setup_configuration({'file': __file__})
+    assert config.get('file', 'read_text').startswith('from pathlib')
 
 
 def test_cast_inexisting(config):
@@ -135,3 +138,69 @@ def test_config_setup_dots(config):
 def test_config_setup_path(config):
     config.setup_configuration({'test': 954}, prefix='a.b')
     assert config.get('a.b.test') == 954
+
+
+def test_config_merge_empty(config):
+    config._merge([OmegaConf.create({}), OmegaConf.create({'x': 1}), OmegaConf.create()])
+    assert config.get('x') == 1
+    assert config.get('a.b') == 3
+
+
+def test_config_setup_dictconfig_copy(config):
+    conf = OmegaConf.create({'copied': {'x': 1}})
+    config.setup_configuration(conf)
+    conf.copied.x = 2
+    assert config.get('copied.x') == 1
+
+
+def test_config_from_environ(config, monkeypatch):
+    monkeypatch.setenv('ENVTEST_A', '5')
+    conf = config.from_environ(['ENVTEST_'])
+    assert conf.envtest.a == 5
+    # invalid yaml values are loaded as strings
+    monkeypatch.setenv('ENVTEST_INVALID', '{x')
+    conf = config.from_environ(['ENVTEST_'])
+    assert conf.envtest.a == 5
+    assert conf.envtest.invalid == '{x'
+
+
+def test_config_from_environ_types(config, monkeypatch):
+    monkeypatch.setenv('ENVTEST_FLAG', 'yes')
+    monkeypatch.setenv('ENVTEST_URL', 'http://localhost:8080/x')
+    monkeypatch.setenv('ENVTEST_NAME', 'hello')
+    monkeypatch.setenv('ENVTEST_KEY', 'name:')
+    conf = config.from_environ(['ENVTEST_'])
+    assert conf.envtest.flag is True
+    assert conf.envtest.url == 'http://localhost:8080/x'
+    assert conf.envtest.name == 'hello'
+    assert conf.envtest.key == {'name': None}
+
+
+def test_config_from_environ_order(config, monkeypatch):
+    # the last variable wins for conflicting paths
+    monkeypatch.setenv('ENVTEST_C', '7')
+    monkeypatch.setenv('ENVTEST_C_D', 'x')
+    monkeypatch.setenv('ENVTEST_E_F', 'x')
+    monkeypatch.setenv('ENVTEST_E', '8')
+    monkeypatch.setenv('ENVTEST_G', 'y')
+    conf = config.from_environ(['ENVTEST_'])
+    assert conf.envtest == {'c': {'d': 'x'}, 'e': 8, 'g': 'y'}
+
+
+def test_get_container_copy(config):
+    value = config.get('a')
+    value['b'] = 'changed'
+    assert config.get('a') == {'b': 3}
+    config.setup_configuration({'a': {'b': 4}})
+    assert config.get('a') == {'b': 4}
+    # changes made directly on the DictConfig are visible
+    config.c.a.b = 5
+    assert config.get('a') == {'b': 5}
+
+
+def test_default_env_prefixes(config):
+    config.setup_configuration({'base': {}, '_private': 1})
+    prefixes = config.default_env_prefixes()
+    assert set(prefixes) == {'A_', 'ROOT_', 'B_', 'NUM_', 'HOME_', 'WITH_UNDERSCORE_'}
+    config.setup_configuration({'new': 1})
+    assert 'NEW_' in config.default_env_prefixes()
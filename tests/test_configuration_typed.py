@@ -98,3 +98,19 @@ def test_set_person_type(config_typed):
     config_typed.setup_configuration(Person(first_name='A', last_name='T'), prefix='x_person')
     person = config_typed.get(Person)
     assert person.full_name == 'A T'
+
+
+def test_get_type_updated(config_typed):
+    v = config_typed.get(TypedConfig)
+    assert config_typed.get(TypedConfig) == v
+    config_typed.setup_configuration({'x_num': 5})
+    assert config_typed.get(TypedConfig).x_num == 5
+    config_typed.c.x_num = 6
+    assert config_typed.get(TypedConfig).x_num == 6
+
+
+def test_get_converted(config_typed):
+    config_typed.setup_configuration({'x_str_num': '7'})
+    assert config_typed.get('x_str_num', int) == 7
+    assert config_typed.get('x_str_num', int) == 7
+    assert config_typed.get('x_str_num', float) == 7.0
@@ -27,9 +27,25 @@ def test_inject(c, mytupledef):
     assert mytuple(0, c=2) == (0, 1, 2, 1, 1)
     assert mytupledef() == (1, 1, 1, 1, 1)
     assert inj.inject("c", lambda: 5)(mytuple)(0) == (0, 1, 5, 1, 1)
+    # given arguments are not injected
+    assert mytupledef(5) == (5, 1, 1, 1, 1)
+    assert mytupledef(a=5, c=6) == (5, 1, 6, 1, 1)
     assert inj.inject("b", lambda: 5)(mytupledef)() == (1, 5, 1, 1, 1)
 
 
+def test_inject_var_args(c):
+    def h(a, *args, **kwargs):
+        return (a, args, kwargs)
+
+    assert inj.inject('args', lambda: (7,))(h)(1, 2, 3) == (1, (2, 3), {})
+    assert inj.inject('kwargs', lambda: 7)(h)(1, x=2) == (1, (), {'x': 2})
+    # given variadic arguments are not injected
+    c.setup_configuration({'args': [8], 'kwargs': {'y': 9}})
+    hauto = inj.inject_auto()(h)
+    assert hauto(5, 6) == (5, (6,), {'kwargs': {'y': 9}})
+    assert hauto(5, x=1) == (5, (), {'x': 1, 'args': [8]})
+
+
 def test_inject_name(c, mytupledef):
     assert inj.inject('a', 'g')(mytuple)(c=0) == (7, 1, 0, 1, 1)
 
@@ -0,0 +1,71 @@
+import os
+
+import pytest
+import yaml
+
+from alphaconf.internal.load_file import read_configuration_file
+
+
+def test_read_yaml(tmp_path):
+    path = tmp_path / 'test.yaml'
+    path.write_text('a:\n  b: 1e3\n  date: 2020-01-01\n')
+    conf = read_configuration_file(str(path))
+    assert conf.a.b == 1000.0
+    assert conf.a.date == '2020-01-01'
+
+
+def test_read_toml(tmp_path):
+    pytest.importorskip('toml')
+    path = tmp_path / 'test.toml'
+    path.write_text('[a]\nb = 1\ndate = 2020-01-01\n')
+    conf = read_configuration_file(str(path))
+    assert conf.a.b == 1
+    assert conf.a.date == '2020-01-01'
+
+
+def test_read_yaml_list(tmp_path):
+    path = tmp_path / 'test.yaml'
+    path.write_text('- 1\n- 2\n')
+    conf = read_configuration_file(str(path))
+    assert list(conf.config) == [1, 2]
+
+
+def test_read_yaml_empty(tmp_path):
+    path = tmp_path / 'test.yaml'
+    path.write_text('')
+    conf = read_configuration_file(str(path))
+    assert len(conf) == 0
+
+
+def test_read_yaml_duplicate_key(tmp_path):
+    path = tmp_path / 'test.yaml'
+    path.write_text('a: 1\na: 2\n')
+    with pytest.raises(yaml.constructor.ConstructorError):
+        read_configuration_file(str(path))
+
+
+def test_read_cached(tmp_path):
+    path = tmp_path / 'test.yaml'
+    path.write_text('a: 1\n')
+    conf = read_configuration_file(str(path))
+    conf.a = 5
+    assert read_configuration_file(str(path)).a == 1
+    # modification time changed, reload the file
+    path.write_text('a: 2\n')
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert read_configuration_file(str(path)).a == 2
+
+
+def test_read_cached_relative(tmp_path, monkeypatch):
+    paths = []
+    for i in (1, 2):
+        path = tmp_path / f"d{i}" / 'c.yaml'
+        path.parent.mkdir()
+        path.write_text(f"a: {i}\n")
+        paths.append(path)
+    stat = paths[0].stat()
+    os.utime(paths[1], ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    for i, path in enumerate(paths, 1):
+        monkeypatch.chdir(path.parent)
+        assert read_configuration_file('c.yaml').a == i
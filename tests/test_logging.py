@@ -1,3 +1,5 @@
+import contextlib
+import io
 import logging
 
 import pytest
@@ -52,3 +54,13 @@ def test_log_format(log, caplog):
         format_str
         == r'%(asctime)s %(levelname)s %(name)s [%(process)s,%(threadName)s]: %(message)s'
     )
+
+
+def test_log_setup_redirected_stdout(application):
+    configuration = application.configuration.get("logging")
+    for _ in range(2):
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            alphaconf.logging_util.setup_application_logging(configuration)
+            logging.getLogger().warning('tredirect')
+        assert 'tredirect' in buffer.getvalue()